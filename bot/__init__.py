@@ -6,7 +6,7 @@ install()
 
 from subprocess import run as srun
 from os import getcwd
-from asyncio import Lock, new_event_loop, set_event_loop
+from asyncio import Lock, eager_task_factory, new_event_loop, set_event_loop
 from logging import (
     ERROR,
     INFO,
@@ -47,6 +47,7 @@ pyroutils.MIN_CHANNEL_ID = -100999999999999
 bot_start_time = time()
 
 bot_loop = new_event_loop()
+bot_loop.set_task_factory(eager_task_factory)
 set_event_loop(bot_loop)
 
 basicConfig(
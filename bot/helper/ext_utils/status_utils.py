@@ -1,12 +1,14 @@
 from asyncio import gather, iscoroutinefunction
+from functools import lru_cache
 from html import escape
-from re import findall
+from math import ceil
 from time import time
 
 from psutil import cpu_percent, disk_usage, virtual_memory
 
 from ... import (
     DOWNLOAD_DIR,
+    LOGGER,
     bot_cache,
     bot_start_time,
     status_dict,
@@ -17,7 +19,44 @@ from ...core.config_manager import Config
 from ..telegram_helper.bot_commands import BotCommands
 from ..telegram_helper.button_build import ButtonMaker
 
-SIZE_UNITS = ["B", "KB", "MB", "GB", "TB", "PB"]
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+SIZE_FMT = "%.2f%s"
+TIME_UNITS = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+SPEED_UNITS = {"b": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+
+# 12 blocks in quarter steps; a partially filled last block gets a quarter glyph
+PROGRESS_BARS = tuple(
+    "[{}{}{}]".format(
+        "𒊹" * (q // 4),
+        ("", "◔", "◑", "◕")[q % 4],
+        "❍" * (12 - q // 4 - (1 if q % 4 else 0)),
+    )
+    for q in range(49)
+)
+
+_FRAG_NAME = "<b>%s.</b> <b><b>%s</b></b>"
+_FRAG_SUBNAME = "\n╰ <b>Sub Name</b> » <i>%s</i>"
+_FRAG_TASK_BY = "\n<blockquote>╭ <b>Task By %s </b>"
+_FRAG_PROGRESS = "\n┊ <b>%s</b> <i>%s</i>"
+_FRAG_STATUS = "\n┊ <b>Status »</b> <b>%s » %s</b>"
+_FRAG_STATUS_LINK = "\n┊ <b>Status »</b> <b><a href='%s'>%s</a> » %s</b>"
+_FRAG_DONE = "\n┊ <b>Done »</b> <i>%s%s / %s</i>"
+_FRAG_COUNT = "\n┊ <b>Count »</b> <b>%s</b>"
+_FRAG_ETA = "\n┊ <b>ETA »</b> <i>%s</i>"
+_FRAG_PAST = "\n┊ <b>Past »</b> <i>%s</i>"
+_FRAG_PAST_ETA = "\n┊ <b>Past »</b> <i>%s (%s)</i>"
+_FRAG_PEERS = "\n┊ <b>S/L »</b> %s / %s "
+_FRAG_RATIO = "\n┊ <b>Ratio »</b> <i>%s</i>"
+_FRAG_SIZE = "\n┊ <b>Size »</b> <i>%s</i>"
+_FRAG_ENGINE = (
+    "\n┊ <b>Engine »</b> <i>%s</i>"
+    "\n╰ <b>Mode »</b> <i>%s</i></blockquote>"
+)
+_FRAG_STOP = "\n<blockquote>⋗ <b>Stop »</b> <i>/%s_%s</i></blockquote>\n\n"
+
+SYS_METRICS_TTL = 2.0
+_sys_metrics_cache = {"t": 0.0, "v": None}
+_header_cache = {"key": None, "v": ""}
 
 
 class MirrorStatus:
@@ -38,19 +77,32 @@ class MirrorStatus:
 
 
 class EngineStatus:
-    def __init__(self):
-        self.STATUS_ARIA2 = f"Aria2 v{bot_cache['eng_versions']['aria2']}"
-        self.STATUS_AIOHTTP = f"AioHttp v{bot_cache['eng_versions']['aiohttp']}"
-        self.STATUS_GDAPI = f"Google-API v{bot_cache['eng_versions']['gapi']}"
-        self.STATUS_QBIT = f"qBit v{bot_cache['eng_versions']['qBittorrent']}"
-        self.STATUS_TGRAM = f"Pyro v{bot_cache['eng_versions']['pyrofork']}"
-        self.STATUS_MEGA = f"MegaAPI v{bot_cache['eng_versions']['mega']}"
-        self.STATUS_YTDLP = f"yt-dlp v{bot_cache['eng_versions']['yt-dlp']}"
-        self.STATUS_FFMPEG = f"ffmpeg v{bot_cache['eng_versions']['ffmpeg']}"
-        self.STATUS_7Z = f"7z v{bot_cache['eng_versions']['7z']}"
-        self.STATUS_RCLONE = f"RClone v{bot_cache['eng_versions']['rclone']}"
-        self.STATUS_QUEUE = "QSystem v2"
-        self.STATUS_JD = "JDownloader v2"
+    STATUS_QUEUE = "QSystem v2"
+    STATUS_JD = "JDownloader v2"
+
+    _instance = None
+    _versions = None
+
+    def __new__(cls):
+        if cls._versions is not bot_cache["eng_versions"]:
+            cls.refresh()
+        return cls._instance
+
+    @classmethod
+    def refresh(cls):
+        versions = bot_cache["eng_versions"]
+        cls.STATUS_ARIA2 = f"Aria2 v{versions['aria2']}"
+        cls.STATUS_AIOHTTP = f"AioHttp v{versions['aiohttp']}"
+        cls.STATUS_GDAPI = f"Google-API v{versions['gapi']}"
+        cls.STATUS_QBIT = f"qBit v{versions['qBittorrent']}"
+        cls.STATUS_TGRAM = f"Pyro v{versions['pyrofork']}"
+        cls.STATUS_MEGA = f"MegaAPI v{versions['mega']}"
+        cls.STATUS_YTDLP = f"yt-dlp v{versions['yt-dlp']}"
+        cls.STATUS_FFMPEG = f"ffmpeg v{versions['ffmpeg']}"
+        cls.STATUS_7Z = f"7z v{versions['7z']}"
+        cls.STATUS_RCLONE = f"RClone v{versions['rclone']}"
+        cls._versions = versions
+        cls._instance = object.__new__(cls)
 
 
 STATUSES = {
@@ -70,45 +122,71 @@ STATUSES = {
     "PA": MirrorStatus.STATUS_PAUSED,
     "CK": MirrorStatus.STATUS_CHECK,
 }
+STATUS_VALUES = frozenset(STATUSES.values())
+NO_PROGRESS_STATUSES = frozenset(
+    [MirrorStatus.STATUS_SEED, MirrorStatus.STATUS_QUEUEUP]
+)
+
+
+@lru_cache(maxsize=None)
+def is_async_method(cls, name):
+    return iscoroutinefunction(getattr(cls, name, None))
+
+
+def _cached_gid(tk):
+    try:
+        return tk.gid()
+    except Exception:
+        return None
 
 
 async def get_task_by_gid(gid: str):
     async with task_dict_lock:
+        stale_tasks = []
         for tk in task_dict.values():
-            if hasattr(tk, "seeding"):
+            if not hasattr(tk, "seeding"):
+                if tk.gid() == gid:
+                    return tk
+            elif _cached_gid(tk) == gid:
                 await tk.update()
+                return tk
+            else:
+                stale_tasks.append(tk)
+        # gid of torrent tasks can change on update (e.g. aria2 followedBy)
+        for tk in stale_tasks:
+            await tk.update()
             if tk.gid() == gid:
                 return tk
         return None
 
 
 async def get_specific_tasks(status, user_id):
+    tasks = [
+        tk
+        for tk in task_dict.values()
+        if not user_id or tk.listener.user_id == user_id
+    ]
     if status == "All":
-        if user_id:
-            return [tk for tk in task_dict.values() if tk.listener.user_id == user_id]
-        else:
-            return list(task_dict.values())
-    tasks_to_check = (
-        [tk for tk in task_dict.values() if tk.listener.user_id == user_id]
-        if user_id
-        else list(task_dict.values())
-    )
-    coro_tasks = []
-    coro_tasks.extend(tk for tk in tasks_to_check if iscoroutinefunction(tk.status))
-    coro_statuses = await gather(*[tk.status() for tk in coro_tasks])
-    result = []
-    coro_index = 0
-    for tk in tasks_to_check:
-        if tk in coro_tasks:
-            st = coro_statuses[coro_index]
-            coro_index += 1
+        return tasks
+    statuses = []
+    coro_indices = []
+    coros = []
+    for index, tk in enumerate(tasks):
+        if is_async_method(type(tk), "status"):
+            coro_indices.append(index)
+            coros.append(tk.status())
+            statuses.append(None)
         else:
-            st = tk.status()
-        if (st == status) or (
-            status == MirrorStatus.STATUS_DOWNLOAD and st not in STATUSES.values()
-        ):
-            result.append(tk)
-    return result
+            statuses.append(tk.status())
+    if coros:
+        for index, st in zip(coro_indices, await gather(*coros)):
+            statuses[index] = st
+    return [
+        tk
+        for tk, st in zip(tasks, statuses)
+        if (st == status)
+        or (status == MirrorStatus.STATUS_DOWNLOAD and st not in STATUS_VALUES)
+    ]
 
 
 async def get_all_tasks(req_status: str, user_id):
@@ -121,69 +199,82 @@ def get_raw_file_size(size):
     return int(float(num) * (1024 ** SIZE_UNITS.index(unit)))
 
 
+@lru_cache(maxsize=4096)
 def get_readable_file_size(size_in_bytes):
     if not size_in_bytes:
         return "0B"
 
+    if isinstance(size_in_bytes, int) and size_in_bytes > 0:
+        index = min((size_in_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+        return SIZE_FMT % (size_in_bytes / (1 << (index * 10)), SIZE_UNITS[index])
+
     index = 0
     while size_in_bytes >= 1024 and index < len(SIZE_UNITS) - 1:
         size_in_bytes /= 1024
         index += 1
 
-    return f"{size_in_bytes:.2f}{SIZE_UNITS[index]}"
+    return SIZE_FMT % (size_in_bytes, SIZE_UNITS[index])
 
 
 def get_readable_time(seconds: int):
-    periods = [("d", 86400), ("h", 3600), ("m", 60), ("s", 1)]
-    result = ""
-    for period_name, period_seconds in periods:
-        if seconds >= period_seconds:
-            period_value, seconds = divmod(seconds, period_seconds)
-            result += f"{int(period_value)}{period_name}"
-    return result
+    return _get_readable_time(int(seconds))
+
+
+@lru_cache(maxsize=4096)
+def _get_readable_time(seconds: int):
+    if seconds <= 0:
+        return ""
+    days, seconds = divmod(seconds, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    parts = []
+    if days:
+        parts.append(f"{days}d")
+    if hours:
+        parts.append(f"{hours}h")
+    if minutes:
+        parts.append(f"{minutes}m")
+    if seconds:
+        parts.append(f"{seconds}s")
+    return "".join(parts)
 
 
 def get_raw_time(time_str: str) -> int:
-    time_units = {"d": 86400, "h": 3600, "m": 60, "s": 1}
-    return sum(
-        int(value) * time_units[unit]
-        for value, unit in findall(r"(\d+)([dhms])", time_str)
-    )
+    total = 0
+    value = None
+    for char in time_str:
+        if "0" <= char <= "9":
+            value = (value or 0) * 10 + ord(char) - 48
+            continue
+        if value is not None and char in TIME_UNITS:
+            total += value * TIME_UNITS[char]
+        value = None
+    return total
 
 
 def time_to_seconds(time_duration):
     try:
         parts = time_duration.split(":")
-        if len(parts) == 3:
-            hours, minutes, seconds = map(float, parts)
-        elif len(parts) == 2:
-            hours = 0
-            minutes, seconds = map(float, parts)
-        elif len(parts) == 1:
-            hours = 0
-            minutes = 0
-            seconds = float(parts[0])
-        else:
+        if len(parts) > 3:
             return 0
-        return hours * 3600 + minutes * 60 + seconds
+        total = 0.0
+        for part, multiplier in zip(reversed(parts), (1, 60, 3600)):
+            total += float(part) * multiplier
+        return total
     except Exception:
         return 0
 
 
 def speed_string_to_bytes(size_text: str):
-    size = 0
     size_text = size_text.lower()
-    if "k" in size_text:
-        size += float(size_text.split("k")[0]) * 1024
-    elif "m" in size_text:
-        size += float(size_text.split("m")[0]) * 1048576
-    elif "g" in size_text:
-        size += float(size_text.split("g")[0]) * 1073741824
-    elif "t" in size_text:
-        size += float(size_text.split("t")[0]) * 1099511627776
-    elif "b" in size_text:
-        size += float(size_text.split("b")[0])
-    return size
+    for index, char in enumerate(size_text):
+        if char.isalpha():
+            break
+    else:
+        return 0
+    if index == 0 or char not in SPEED_UNITS:
+        return 0
+    return float(size_text[:index]) * SPEED_UNITS[char]
 
 
 def get_progress_bar_string(pct: str):
@@ -192,34 +283,130 @@ def get_progress_bar_string(pct: str):
     except (ValueError, AttributeError):
         pct_float = 0.0
     pct = max(0.0, min(100.0, pct_float))
-    total_blocks = 12
-    filled_blocks = int(pct / (100 / total_blocks))
-    remaining_ratio = (pct % (100 / total_blocks)) / (100 / total_blocks)
-    p_str = ""
-    p_str += "𒊹" * filled_blocks
-    if filled_blocks < total_blocks and remaining_ratio > 0:
-        if remaining_ratio <= 0.25:
-            p_str += "◔"
-        elif remaining_ratio <= 0.5:
-            p_str += "◑"
-        elif remaining_ratio <= 0.75:
-            p_str += "◕"
-        else: # remaining_ratio <= 1.0
-            p_str += "𒊹" # Treat as full if very close
-        filled_blocks += 1 
-    p_str += "❍" * (total_blocks - filled_blocks)
-
-    return f"[{p_str}]"
+    return PROGRESS_BARS[ceil(pct * 48 / 100)]
 
 
+def _get_sys_metrics():
+    now = time()
+    if (
+        _sys_metrics_cache["v"] is None
+        or now - _sys_metrics_cache["t"] > SYS_METRICS_TTL
+    ):
+        _sys_metrics_cache["v"] = (
+            cpu_percent(interval=None),
+            disk_usage(DOWNLOAD_DIR).free,
+            virtual_memory().percent,
+        )
+        _sys_metrics_cache["t"] = now
+    return _sys_metrics_cache["v"]
+
+
+async def _get_task_values(task, *attrs):
+    values = []
+    coros = []
+    for attr in attrs:
+        method = getattr(task, attr)
+        if is_async_method(type(task), attr):
+            coros.append((len(values), method()))
+            values.append(None)
+        else:
+            values.append(method())
+    if coros:
+        results = await gather(*(coro for _, coro in coros))
+        for (index, _), result in zip(coros, results):
+            values[index] = result
+    return values
+
+
+async def _render_task(task, index, status):
+    listener = task.listener
+    subname = listener.subname
+    parts = []
+    if status != "All":
+        tstatus = status
+    else:
+        (tstatus,) = await _get_task_values(task, "status")
+    parts.append(_FRAG_NAME % (index, escape(f"{task.name()}")))
+    if subname:
+        parts.append(_FRAG_SUBNAME % subname)
+    elapsed = time() - listener.message.date.timestamp()
+
+    user = listener.message.from_user.mention(style="html")
+    parts.append(_FRAG_TASK_BY % user)
+
+    if tstatus not in NO_PROGRESS_STATUSES and listener.progress:
+        progress, speed, processed, size, eta = await _get_task_values(
+            task, "progress", "speed", "processed_bytes", "size", "eta"
+        )
+        parts.append(_FRAG_PROGRESS % (get_progress_bar_string(progress), progress))
+        if subname:
+            subsize = f" / {get_readable_file_size(listener.subsize)}"
+            ac = len(listener.files_to_proceed)
+            count = f"( {listener.proceed_count} / {ac or '?'} )"
+        else:
+            subsize = ""
+            count = ""
+        if listener.is_super_chat:
+            parts.append(_FRAG_STATUS_LINK % (listener.message.link, tstatus, speed))
+        else:
+            parts.append(_FRAG_STATUS % (tstatus, speed))
+        parts.append(_FRAG_DONE % (processed, subsize, size))
+        if count:
+            parts.append(_FRAG_COUNT % count)
+        parts.append(_FRAG_ETA % eta)
+        parts.append(
+            _FRAG_PAST_ETA
+            % (
+                get_readable_time(elapsed + get_raw_time(eta)),
+                get_readable_time(elapsed),
+            )
+        )
+        if tstatus == MirrorStatus.STATUS_DOWNLOAD and (
+            listener.is_torrent or listener.is_qbit
+        ):
+            try:
+                parts.append(
+                    _FRAG_PEERS % (task.seeders_num(), task.leechers_num())
+                )
+            except Exception:
+                pass
+        # TODO: Add Connected Peers
+    elif tstatus == MirrorStatus.STATUS_SEED:
+        seed_speed, uploaded, size, ratio, seeding_time = await _get_task_values(
+            task, "seed_speed", "uploaded_bytes", "size", "ratio", "seeding_time"
+        )
+        parts.append(_FRAG_STATUS % (tstatus, seed_speed))
+        parts.append(_FRAG_DONE % (uploaded, "", size))
+        parts.append(_FRAG_RATIO % ratio)
+        parts.append(_FRAG_ETA % seeding_time)
+        parts.append(_FRAG_PAST % get_readable_time(elapsed))
+    else:
+        (size,) = await _get_task_values(task, "size")
+        parts.append(_FRAG_SIZE % size)
+    parts.append(_FRAG_ENGINE % (task.engine, listener.mode[1]))
+    # TODO: Add Bt Sel
+    parts.append(_FRAG_STOP % (BotCommands.CancelTaskCommand[1], task.gid()))
+    return "".join(parts)
+
+
+def _get_bot_header():
+    key = (Config.CUSTOM_BOT_HEADER, Config.CUSTOM_BOT_HEADER_LINK)
+    if _header_cache["key"] != key:
+        bot_header = key[0] or "TellY Mirror"
+        bot_header_link = key[1] or "https://t.me/tellY_mirrror"
+        _header_cache["v"] = (
+            f"<blockquote><b><i><a href='{bot_header_link}'>Powered By {bot_header}"
+            "</a></i></b>\n\n</blockquote>"
+        )
+        _header_cache["key"] = key
+    return _header_cache["v"]
+
 
 async def get_readable_message(sid, is_user, page_no=1, status="All", page_step=1):
-    msg = ""
+    parts = []
     button = None
 
-    bot_header = Config.CUSTOM_BOT_HEADER or "TellY Mirror"
-    bot_header_link = Config.CUSTOM_BOT_HEADER_LINK or "https://t.me/tellY_mirrror"
-    msg += f"<blockquote><b><i><a href='{bot_header_link}'>Powered By {bot_header}</a></i></b>\n\n</blockquote>"
+    parts.append(_get_bot_header())
 
     tasks = await get_specific_tasks(status, sid if is_user else None)
 
@@ -234,77 +421,36 @@ async def get_readable_message(sid, is_user, page_no=1, status="All", page_step=
         status_dict[sid]["page_no"] = page_no
     start_position = (page_no - 1) * STATUS_LIMIT
 
-    for index, task in enumerate(
-        tasks[start_position : STATUS_LIMIT + start_position], start=1
+    page_tasks = tasks[start_position : STATUS_LIMIT + start_position]
+    rendered = await gather(
+        *(
+            _render_task(task, index, status)
+            for index, task in enumerate(page_tasks, start=start_position + 1)
+        ),
+        return_exceptions=True,
+    )
+    for index, (task, fragment) in enumerate(
+        zip(page_tasks, rendered), start=start_position + 1
     ):
-        if status != "All":
-            tstatus = status
-        elif iscoroutinefunction(task.status):
-            tstatus = await task.status()
-        else:
-            tstatus = task.status()
-        msg += f"<b>{index + start_position}.</b> "
-        msg += f"<b><b>{escape(f'{task.name()}')}</b></b>"
-        if task.listener.subname:
-            msg += f"\n╰ <b>Sub Name</b> » <i>{task.listener.subname}</i>"
-        elapsed = time() - task.listener.message.date.timestamp()
-
-        msg += f"\n<blockquote>╭ <b>Task By {task.listener.message.from_user.mention(style='html')} </b>"
-
-        if (
-            tstatus not in [MirrorStatus.STATUS_SEED, MirrorStatus.STATUS_QUEUEUP]
-            and task.listener.progress
-        ):
-            progress = task.progress()
-            msg += f"\n┊ <b>{get_progress_bar_string(progress)}</b> <i>{progress}</i>"
-            if task.listener.subname:
-                subsize = f" / {get_readable_file_size(task.listener.subsize)}"
-                ac = len(task.listener.files_to_proceed)
-                count = f"( {task.listener.proceed_count} / {ac or '?'} )"
-            else:
-                subsize = ""
-                count = ""
-            if task.listener.is_super_chat:
-                msg += f"\n┊ <b>Status »</b> <b><a href='{task.listener.message.link}'>{tstatus}</a> » {task.speed()}</b>"
-            else:
-                msg += f"\n┊ <b>Status »</b> <b>{tstatus} » {task.speed()}</b>"
-            msg += f"\n┊ <b>Done »</b> <i>{task.processed_bytes()}{subsize} / {task.size()}</i>"
-            if count:
-                msg += f"\n┊ <b>Count »</b> <b>{count}</b>"
-            msg += f"\n┊ <b>ETA »</b> <i>{task.eta()}</i>"
-            msg += f"\n┊ <b>Past »</b> <i>{get_readable_time(elapsed + get_raw_time(task.eta()))} ({get_readable_time(elapsed)})</i>"
-            if tstatus == MirrorStatus.STATUS_DOWNLOAD and (
-                task.listener.is_torrent or task.listener.is_qbit
-            ):
-                try:
-                    msg += f"\n┊ <b>S/L »</b> {task.seeders_num()} / {task.leechers_num()} "
-                except Exception:
-                    pass
-            # TODO: Add Connected Peers
-        elif tstatus == MirrorStatus.STATUS_SEED:
-            msg += f"\n┊ <b>Status »</b> <b>{tstatus} » {task.seed_speed()}</b>"
-            msg += f"\n┊ <b>Done »</b> <i>{task.uploaded_bytes()} / {task.size()}</i>"
-            msg += f"\n┊ <b>Ratio »</b> <i>{task.ratio()}</i>"
-            msg += f"\n┊ <b>ETA »</b> <i>{task.seeding_time()}</i>"
-            msg += f"\n┊ <b>Past »</b> <i>{get_readable_time(elapsed)}</i>"
+        if isinstance(fragment, str):
+            parts.append(fragment)
         else:
-            msg += f"\n┊ <b>Size »</b> <i>{task.size()}</i>"
-        msg += f"\n┊ <b>Engine »</b> <i>{task.engine}</i>"
-        msg += f"\n╰ <b>Mode »</b> <i>{task.listener.mode[1]}</i></blockquote>"
-        # TODO: Add Bt Sel
-        msg += f"\n<blockquote>⋗ <b>Stop »</b> <i>/{BotCommands.CancelTaskCommand[1]}_{task.gid()}</i></blockquote>\n\n"
+            LOGGER.error(
+                f"Failed to render status of task {index} "
+                f"({type(task).__name__}): {fragment!r}"
+            )
 
-    if len(msg) == 0:
+    if not any(parts):
         if status == "All":
             return None, None
         else:
-            msg = f"No Active {status} Tasks!\n\n"
+            parts.append(f"No Active {status} Tasks!\n\n")
 
     buttons = ButtonMaker()
     if not is_user:
         buttons.data_button("☲", f"status {sid} ov", position="header")
     if len(tasks) > STATUS_LIMIT:
-        msg += f"<b>Page:</b> {page_no}/{pages} | <b>Tasks:</b> {tasks_no} | <b>Step:</b> {page_step}\n"
+        parts.append(f"<b>Page:</b> {page_no}/{pages} | <b>Tasks:</b> {tasks_no} | <b>Step:</b> {page_step}\n")
         buttons.data_button("❰", f"status {sid} pre", position="header")
         buttons.data_button("❱", f"status {sid} nex", position="header")
         if tasks_no > 30:
@@ -318,9 +464,10 @@ async def get_readable_message(sid, is_user, page_no=1, status="All", page_step=
     button = buttons.build_menu(8)
 
 # System stats footer
-    msg += "\n"
-    msg += "⌬ <b><i>𝗕𝗢𝗧 𝗦𝗧𝗔𝗧𝗦</i></b>"
-    msg += "\n▬▬▬▬▬▬▬▬▬▬▬▬▬▬▬✘▬\n"
-    msg += f"╭<b>CPU »</b> {cpu_percent()}% | <b>FREE »</b> {get_readable_file_size(disk_usage(DOWNLOAD_DIR).free)}\n"
-    msg += f"╰<b>RAM »</b> {virtual_memory().percent}% | <b>UP »</b> {get_readable_time(time() - bot_start_time)}\n"
-    return msg, button
+    parts.append("\n")
+    parts.append("⌬ <b><i>𝗕𝗢𝗧 𝗦𝗧𝗔𝗧𝗦</i></b>")
+    parts.append("\n▬▬▬▬▬▬▬▬▬▬▬▬▬▬▬✘▬\n")
+    cpu, free, ram = _get_sys_metrics()
+    parts.append(f"╭<b>CPU »</b> {cpu}% | <b>FREE »</b> {get_readable_file_size(free)}\n")
+    parts.append(f"╰<b>RAM »</b> {ram}% | <b>UP »</b> {get_readable_time(time() - bot_start_time)}\n")
+    return "".join(parts), button
@@ -1,6 +1,6 @@
 from psutil import cpu_percent, virtual_memory, disk_usage
 from time import time
-from asyncio import gather, iscoroutinefunction
+from asyncio import gather
 
 from pyrogram.errors import QueryIdInvalid
 
@@ -20,6 +20,7 @@ from ..helper.ext_utils.status_utils import (
     MirrorStatus,
     get_readable_file_size,
     get_readable_time,
+    is_async_method,
     speed_string_to_bytes,
 )
 from ..helper.telegram_helper.bot_commands import BotCommands
@@ -183,7 +184,7 @@ async def get_download_status(download):
     return (
         (
             await download.status()
-            if iscoroutinefunction(download.status)
+            if is_async_method(type(download), "status")
             else download.status()
         ),
         speed,